@@ -30,4 +30,21 @@ api.interceptors.response.use(
     }
     return Promise.reject(error);
   }
-);
\ No newline at end of file
+);
+
+const PAGE_SIZE = 200;
+
+// List endpoints are paginated; walk every page using the X-Total-Count header.
+export const fetchAllPages = async (path, params = {}) => {
+  const items = [];
+  let total = Infinity;
+  while (items.length < total) {
+    const response = await api.get(path, {
+      params: { ...params, limit: PAGE_SIZE, offset: items.length },
+    });
+    items.push(...response.data);
+    total = Number(response.headers['x-total-count'] ?? items.length);
+    if (response.data.length === 0) break;
+  }
+  return items;
+};
\ No newline at end of file
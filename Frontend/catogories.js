@@ -4,7 +4,7 @@ import { Input } from '@/components/ui/input';
 import { Label } from '@/components/ui/label';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Dialog, DialogContent, DialogDescription, DialogHeader, DialogTitle, DialogTrigger } from '@/components/ui/dialog';
-import { api } from '@/utils/api';
+import { api, fetchAllPages } from '@/utils/api';
 import { toast } from 'sonner';
 import { Plus, FolderTree } from 'lucide-react';
 
@@ -22,8 +22,7 @@ export default function Categories() {
 
   const fetchCategories = async () => {
     try {
-      const response = await api.get('/categories');
-      setCategories(response.data);
+      setCategories(await fetchAllPages('/categories'));
     } catch (error) {
       toast.error('Failed to load categories');
     }
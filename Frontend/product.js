@@ -7,7 +7,7 @@ import { Dialog, DialogContent, DialogDescription, DialogHeader, DialogTitle, Di
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select';
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from '@/components/ui/table';
 import { Badge } from '@/components/ui/badge';
-import { api } from '@/utils/api';
+import { api, fetchAllPages } from '@/utils/api';
 import { toast } from 'sonner';
 import { Plus, Edit, Trash2, AlertTriangle } from 'lucide-react';
 
@@ -34,8 +34,7 @@ export default function Products() {
 
   const fetchProducts = async () => {
     try {
-      const response = await api.get('/products');
-      setProducts(response.data);
+      setProducts(await fetchAllPages('/products'));
     } catch (error) {
       toast.error('Failed to load products');
     }
@@ -43,8 +42,7 @@ export default function Products() {
 
   const fetchCategories = async () => {
     try {
-      const response = await api.get('/categories');
-      setCategories(response.data);
+      setCategories(await fetchAllPages('/categories'));
     } catch (error) {
       toast.error('Failed to load categories');
     }
@@ -1,7 +1,7 @@
 import { useState, useEffect } from 'react';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card';
 import { Badge } from '@/components/ui/badge';
-import { api } from '@/utils/api';
+import { api, fetchAllPages } from '@/utils/api';
 import { toast } from 'sonner';
 import { TrendingUp, Package, DollarSign, AlertCircle } from 'lucide-react';
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer } from 'recharts';
@@ -17,13 +17,13 @@ export default function Reports() {
 
   const fetchData = async () => {
     try {
-      const [productsRes, categoriesRes, statsRes] = await Promise.all([
-        api.get('/products'),
-        api.get('/categories'),
+      const [allProducts, allCategories, statsRes] = await Promise.all([
+        fetchAllPages('/products'),
+        fetchAllPages('/categories'),
         api.get('/dashboard/stats')
       ]);
-      setProducts(productsRes.data);
-      setCategories(categoriesRes.data);
+      setProducts(allProducts);
+      setCategories(allCategories);
       setStats(statsRes.data);
     } catch (error) {
       toast.error('Failed to load reports');
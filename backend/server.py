@@ -1,41 +1,78 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Query, Response, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 import os
+import asyncio
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict, EmailStr
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import uuid
 from datetime import datetime, timezone, timedelta
-from passlib.context import CryptContext
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+import bcrypt
+from cachetools import TTLCache
+import hashlib
+import time
 import jwt
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncMongoClient(
+    mongo_url,
+    tz_aware=True,
+    maxPoolSize=int(os.environ.get('MONGO_MAX_POOL_SIZE', '50')),
+    minPoolSize=5,
+    maxIdleTimeMS=30000,
+    serverSelectionTimeoutMS=3000,
+    socketTimeoutMS=5000
+)
 db = client[os.environ['DB_NAME']]
 
-app = FastAPI()
+redis_url = os.environ.get('REDIS_URL')
+redis_client = Redis.from_url(redis_url, socket_connect_timeout=1, socket_timeout=1) if redis_url else None
+REDIS_CACHE_TTL_SECONDS = 60
+CATEGORIES_GENERATION_KEY = "cats:gen"
+
+async def redis_call(command: str, *args, **kwargs):
+    # The cache is best-effort: when Redis is unset or unreachable, callers fall back to MongoDB.
+    if redis_client is None:
+        return None
+    try:
+        return await getattr(redis_client, command)(*args, **kwargs)
+    except RedisError:
+        logger.warning("Redis %s failed, falling back to MongoDB", command, exc_info=True)
+        return None
+
+app = FastAPI(default_response_class=ORJSONResponse)
 api_router = APIRouter(prefix="/api")
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+password_hasher = PasswordHasher(time_cost=2, memory_cost=19456)
 security = HTTPBearer()
 
 JWT_SECRET = os.environ.get('JWT_SECRET', 'stacko-robo-secret-key-2026')
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_HOURS = 24
+_jwt_options = {"require": ["exp", "sub"]}
+
+AUTH_CACHE_TTL_SECONDS = 30
+_auth_cache = TTLCache(maxsize=10000, ttl=AUTH_CACHE_TTL_SECONDS)
 
 class User(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     email: EmailStr
     name: str
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class UserCreate(BaseModel):
     email: EmailStr
@@ -53,10 +90,10 @@ class Token(BaseModel):
 
 class Category(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     name: str
     description: Optional[str] = None
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class CategoryCreate(BaseModel):
     name: str
@@ -64,7 +101,7 @@ class CategoryCreate(BaseModel):
 
 class Product(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     name: str
     sku: str
     category: str
@@ -72,8 +109,8 @@ class Product(BaseModel):
     unit_price: float
     reorder_level: int
     description: Optional[str] = None
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
-    updated_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class ProductCreate(BaseModel):
     name: str
@@ -105,11 +142,23 @@ class StockDistribution(BaseModel):
     count: int
     total_value: float
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    if hashed_password.startswith("$argon2"):
+        try:
+            password_hasher.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False, None
+        if password_hasher.check_needs_rehash(hashed_password):
+            return True, password_hasher.hash(plain_password)
+        return True, None
+    
+    # Legacy bcrypt hashes are migrated to argon2 on their first successful login.
+    if not bcrypt.checkpw(plain_password.encode(), hashed_password.encode()):
+        return False, None
+    return True, password_hasher.hash(plain_password)
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
 
 def create_access_token(data: dict) -> str:
     to_encode = data.copy()
@@ -119,47 +168,76 @@ def create_access_token(data: dict) -> str:
     return encoded_jwt
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> User:
+    token = credentials.credentials
+    key = hashlib.sha256(token.encode()).digest()
+    cached = _auth_cache.get(key)
+    if cached is not None:
+        user, exp = cached
+        if exp > time.time():
+            return user
+        _auth_cache.pop(key, None)
+
     try:
-        token = credentials.credentials
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM], options=_jwt_options)
         user_id: str = payload.get("sub")
         if user_id is None:
             raise HTTPException(status_code=401, detail="Invalid authentication credentials")
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token has expired")
-    except jwt.JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Could not validate credentials")
     
-    user = await db.users.find_one({"id": user_id}, {"_id": 0})
-    if user is None:
-        raise HTTPException(status_code=401, detail="User not found")
-    return User(**user)
+    redis_key = f"auth:{key.hex()}"
+    cached_user = await redis_call("get", redis_key)
+    if cached_user is not None:
+        user = User.model_validate_json(cached_user)
+    else:
+        user = await db.users.find_one({"id": user_id}, {"_id": 0, "password_hash": 0})
+        if user is None:
+            raise HTTPException(status_code=401, detail="User not found")
+        user = User(**user)
+        await redis_call("set", redis_key, user.model_dump_json(), ex=REDIS_CACHE_TTL_SECONDS)
+    
+    # The cache TTL bounds staleness; the stored exp stops a hit outliving the token.
+    _auth_cache[key] = (user, payload["exp"])
+    return user
 
 @api_router.post("/auth/register", response_model=Token)
 async def register(user_data: UserCreate):
-    existing_user = await db.users.find_one({"email": user_data.email}, {"_id": 0})
+    existing_user = await db.users.find_one({"email": user_data.email}, {"_id": 1})
     if existing_user:
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    user = User(
-        email=user_data.email,
-        name=user_data.name
-    )
+    user = {
+        "id": uuid.uuid4().hex,
+        "email": user_data.email,
+        "name": user_data.name,
+        "created_at": datetime.now(timezone.utc)
+    }
+    password_hash = await asyncio.to_thread(get_password_hash, user_data.password)
     
-    user_dict = user.model_dump()
-    user_dict["password_hash"] = get_password_hash(user_data.password)
-    
-    await db.users.insert_one(user_dict)
+    try:
+        await db.users.insert_one({**user, "password_hash": password_hash})
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already registered")
     
-    access_token = create_access_token(data={"sub": user.id})
-    return Token(access_token=access_token, token_type="bearer", user=user)
+    access_token = create_access_token(data={"sub": user["id"]})
+    return ORJSONResponse(content={"access_token": access_token, "token_type": "bearer", "user": user})
 
 @api_router.post("/auth/login", response_model=Token)
 async def login(credentials: UserLogin):
     user = await db.users.find_one({"email": credentials.email}, {"_id": 0})
-    if not user or not verify_password(credentials.password, user["password_hash"]):
+    if not user:
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
+    verified, new_hash = await asyncio.to_thread(
+        verify_and_update_password, credentials.password, user["password_hash"]
+    )
+    if not verified:
+        raise HTTPException(status_code=401, detail="Invalid email or password")
+    if new_hash:
+        await db.users.update_one({"id": user["id"]}, {"$set": {"password_hash": new_hash}})
+    
     user_obj = User(**user)
     access_token = create_access_token(data={"sub": user_obj.id})
     return Token(access_token=access_token, token_type="bearer", user=user_obj)
@@ -169,46 +247,76 @@ async def get_me(current_user: User = Depends(get_current_user)):
     return current_user
 
 @api_router.get("/categories", response_model=List[Category])
-async def get_categories(current_user: User = Depends(get_current_user)):
-    categories = await db.categories.find({}, {"_id": 0}).to_list(1000)
-    return categories
+async def get_categories(
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    current_user: User = Depends(get_current_user)
+):
+    # Writes bump the generation, so pages cached under an older one are never read again.
+    generation = await redis_call("incrby", CATEGORIES_GENERATION_KEY, 0)
+    page_key = f"cats:{generation}:{offset}:{limit}" if generation is not None else None
+    count_key = f"cats:{generation}:count"
+    if page_key:
+        cached, cached_total = await redis_call("mget", page_key, count_key) or (None, None)
+        if cached is not None and cached_total is not None:
+            return Response(
+                content=cached,
+                media_type="application/json",
+                headers={"X-Total-Count": cached_total.decode()}
+            )
+    
+    total, categories = await asyncio.gather(
+        db.categories.count_documents({}),
+        db.categories.find({}, {"_id": 0}).sort("_id", 1).skip(offset).limit(limit).to_list(None)
+    )
+    response = ORJSONResponse(content=categories, headers={"X-Total-Count": str(total)})
+    if page_key:
+        await redis_call("set", page_key, response.body, ex=REDIS_CACHE_TTL_SECONDS)
+        await redis_call("set", count_key, total, ex=REDIS_CACHE_TTL_SECONDS)
+    return response
 
 @api_router.post("/categories", response_model=Category)
 async def create_category(category_data: CategoryCreate, current_user: User = Depends(get_current_user)):
-    existing = await db.categories.find_one({"name": category_data.name}, {"_id": 0})
-    if existing:
+    category = {"id": uuid.uuid4().hex, **category_data.model_dump(), "created_at": datetime.now(timezone.utc)}
+    try:
+        await db.categories.insert_one(category)
+    except DuplicateKeyError:
         raise HTTPException(status_code=400, detail="Category already exists")
-    
-    category = Category(**category_data.model_dump())
-    await db.categories.insert_one(category.model_dump())
-    return category
+    # insert_one stores the generated ObjectId on the dict itself.
+    category.pop("_id")
+    await redis_call("incr", CATEGORIES_GENERATION_KEY)
+    return ORJSONResponse(content=category)
 
 @api_router.get("/products", response_model=List[Product])
 async def get_products(
     category: Optional[str] = None,
     low_stock: Optional[bool] = None,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
     current_user: User = Depends(get_current_user)
 ):
     query = {}
     if category:
         query["category"] = category
-    
-    products = await db.products.find(query, {"_id": 0}).to_list(1000)
-    
     if low_stock:
-        products = [p for p in products if p["quantity"] <= p["reorder_level"]]
+        query["$expr"] = {"$lte": ["$quantity", "$reorder_level"]}
     
-    return products
+    total, products = await asyncio.gather(
+        db.products.count_documents(query),
+        db.products.find(query, {"_id": 0}).sort("_id", 1).skip(offset).limit(limit).to_list(None)
+    )
+    return ORJSONResponse(content=products, headers={"X-Total-Count": str(total)})
 
 @api_router.post("/products", response_model=Product)
 async def create_product(product_data: ProductCreate, current_user: User = Depends(get_current_user)):
-    existing = await db.products.find_one({"sku": product_data.sku}, {"_id": 0})
-    if existing:
+    now = datetime.now(timezone.utc)
+    product = {"id": uuid.uuid4().hex, **product_data.model_dump(), "created_at": now, "updated_at": now}
+    try:
+        await db.products.insert_one(product)
+    except DuplicateKeyError:
         raise HTTPException(status_code=400, detail="SKU already exists")
-    
-    product = Product(**product_data.model_dump())
-    await db.products.insert_one(product.model_dump())
-    return product
+    product.pop("_id")
+    return ORJSONResponse(content=product)
 
 @api_router.put("/products/{product_id}", response_model=Product)
 async def update_product(
@@ -216,21 +324,20 @@ async def update_product(
     product_data: ProductUpdate,
     current_user: User = Depends(get_current_user)
 ):
-    existing = await db.products.find_one({"id": product_id}, {"_id": 0})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Product not found")
-    
     update_data = {k: v for k, v in product_data.model_dump().items() if v is not None}
-    update_data["updated_at"] = datetime.now(timezone.utc).isoformat()
-    
-    if "sku" in update_data and update_data["sku"] != existing["sku"]:
-        sku_exists = await db.products.find_one({"sku": update_data["sku"], "id": {"$ne": product_id}}, {"_id": 0})
-        if sku_exists:
-            raise HTTPException(status_code=400, detail="SKU already exists")
-    
-    await db.products.update_one({"id": product_id}, {"$set": update_data})
+    update_data["updated_at"] = datetime.now(timezone.utc)
     
-    updated_product = await db.products.find_one({"id": product_id}, {"_id": 0})
+    try:
+        updated_product = await db.products.find_one_and_update(
+            {"id": product_id},
+            {"$set": update_data},
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="SKU already exists")
+    if updated_product is None:
+        raise HTTPException(status_code=404, detail="Product not found")
     return Product(**updated_product)
 
 @api_router.delete("/products/{product_id}")
@@ -242,38 +349,62 @@ async def delete_product(product_id: str, current_user: User = Depends(get_curre
 
 @api_router.get("/dashboard/stats", response_model=DashboardStats)
 async def get_dashboard_stats(current_user: User = Depends(get_current_user)):
-    products = await db.products.find({}, {"_id": 0}).to_list(1000)
+    cursor = await db.products.aggregate([
+        {"$group": {
+            "_id": None,
+            "total_products": {"$sum": 1},
+            "low_stock_count": {"$sum": {"$cond": [{"$lte": ["$quantity", "$reorder_level"]}, 1, 0]}},
+            "total_stock_value": {"$sum": {"$multiply": ["$quantity", "$unit_price"]}},
+            "total_quantity": {"$sum": "$quantity"}
+        }},
+        {"$project": {"_id": 0}}
+    ])
+    totals = await cursor.to_list(1)
     categories_count = await db.categories.count_documents({})
     
-    total_products = len(products)
-    low_stock_count = sum(1 for p in products if p["quantity"] <= p["reorder_level"])
-    total_stock_value = sum(p["quantity"] * p["unit_price"] for p in products)
-    total_quantity = sum(p["quantity"] for p in products)
-    
-    return DashboardStats(
-        total_products=total_products,
-        total_categories=categories_count,
-        low_stock_count=low_stock_count,
-        total_stock_value=total_stock_value,
-        total_quantity=total_quantity
-    )
+    stats = totals[0] if totals else {
+        "total_products": 0,
+        "low_stock_count": 0,
+        "total_stock_value": 0.0,
+        "total_quantity": 0
+    }
+    stats["total_categories"] = categories_count
+    return ORJSONResponse(content=stats)
 
 @api_router.get("/dashboard/stock-distribution", response_model=List[StockDistribution])
 async def get_stock_distribution(current_user: User = Depends(get_current_user)):
-    products = await db.products.find({}, {"_id": 0}).to_list(1000)
-    
-    distribution = {}
-    for product in products:
-        category = product["category"]
-        if category not in distribution:
-            distribution[category] = {"count": 0, "total_value": 0}
-        distribution[category]["count"] += 1
-        distribution[category]["total_value"] += product["quantity"] * product["unit_price"]
-    
-    return [
-        StockDistribution(category=cat, count=data["count"], total_value=data["total_value"])
-        for cat, data in distribution.items()
-    ]
+    cursor = await db.products.aggregate([
+        {"$group": {
+            "_id": "$category",
+            "count": {"$sum": 1},
+            "total_value": {"$sum": {"$multiply": ["$quantity", "$unit_price"]}}
+        }},
+        {"$sort": {"_id": 1}},
+        {"$project": {"_id": 0, "category": "$_id", "count": 1, "total_value": 1}}
+    ])
+    distribution = await cursor.to_list(None)
+    return ORJSONResponse(content=distribution)
+
+SEED_CATEGORIES = (
+    ("Electronics", "Electronic devices and accessories"),
+    ("Furniture", "Office and home furniture"),
+    ("Stationery", "Office supplies and stationery"),
+    ("Clothing", "Apparel and accessories"),
+    ("Food & Beverages", "Food items and drinks")
+)
+
+SEED_PRODUCTS = (
+    ("Laptop Dell XPS 15", "ELEC-001", "Electronics", 25, 1299.99, 10, "High-performance laptop"),
+    ("Wireless Mouse", "ELEC-002", "Electronics", 150, 29.99, 50, "Ergonomic wireless mouse"),
+    ("Office Chair Premium", "FURN-001", "Furniture", 8, 299.99, 15, "Ergonomic office chair"),
+    ("Standing Desk", "FURN-002", "Furniture", 12, 499.99, 10, "Adjustable standing desk"),
+    ("Notebook A4", "STAT-001", "Stationery", 500, 3.99, 100, "Ruled notebook"),
+    ("Ballpoint Pens (Pack of 10)", "STAT-002", "Stationery", 5, 5.99, 50, "Blue ink pens"),
+    ("Business Shirt", "CLTH-001", "Clothing", 45, 49.99, 20, "Formal business shirt"),
+    ("Coffee Beans (1kg)", "FOOD-001", "Food & Beverages", 3, 24.99, 20, "Premium arabica beans"),
+    ("Bottled Water (24 pack)", "FOOD-002", "Food & Beverages", 80, 8.99, 30, "Natural spring water"),
+    ("USB-C Cable", "ELEC-003", "Electronics", 200, 12.99, 80, "2m USB-C charging cable")
+)
 
 @api_router.post("/seed-data")
 async def seed_data():
@@ -281,26 +412,28 @@ async def seed_data():
     if existing_categories > 0:
         return {"message": "Data already seeded"}
     
+    now = datetime.now(timezone.utc)
     categories = [
-        {"id": str(uuid.uuid4()), "name": "Electronics", "description": "Electronic devices and accessories", "created_at": datetime.now(timezone.utc).isoformat()},
-        {"id": str(uuid.uuid4()), "name": "Furniture", "description": "Office and home furniture", "created_at": datetime.now(timezone.utc).isoformat()},
-        {"id": str(uuid.uuid4()), "name": "Stationery", "description": "Office supplies and stationery", "created_at": datetime.now(timezone.utc).isoformat()},
-        {"id": str(uuid.uuid4()), "name": "Clothing", "description": "Apparel and accessories", "created_at": datetime.now(timezone.utc).isoformat()},
-        {"id": str(uuid.uuid4()), "name": "Food & Beverages", "description": "Food items and drinks", "created_at": datetime.now(timezone.utc).isoformat()}
+        {"id": uuid.uuid4().hex, "name": name, "description": description, "created_at": now}
+        for name, description in SEED_CATEGORIES
     ]
     await db.categories.insert_many(categories)
+    await redis_call("incr", CATEGORIES_GENERATION_KEY)
     
     products = [
-        {"id": str(uuid.uuid4()), "name": "Laptop Dell XPS 15", "sku": "ELEC-001", "category": "Electronics", "quantity": 25, "unit_price": 1299.99, "reorder_level": 10, "description": "High-performance laptop", "created_at": datetime.now(timezone.utc).isoformat(), "updated_at": datetime.now(timezone.utc).isoformat()},
-        {"id": str(uuid.uuid4()), "name": "Wireless Mouse", "sku": "ELEC-002", "category": "Electronics", "quantity": 150, "unit_price": 29.99, "reorder_level": 50, "description": "Ergonomic wireless mouse", "created_at": datetime.now(timezone.utc).isoformat(), "updated_at": datetime.now(timezone.utc).isoformat()},
-        {"id": str(uuid.uuid4()), "name": "Office Chair Premium", "sku": "FURN-001", "category": "Furniture", "quantity": 8, "unit_price": 299.99, "reorder_level": 15, "description": "Ergonomic office chair", "created_at": datetime.now(timezone.utc).isoformat(), "updated_at": datetime.now(timezone.utc).isoformat()},
-        {"id": str(uuid.uuid4()), "name": "Standing Desk", "sku": "FURN-002", "category": "Furniture", "quantity": 12, "unit_price": 499.99, "reorder_level": 10, "description": "Adjustable standing desk", "created_at": datetime.now(timezone.utc).isoformat(), "updated_at": datetime.now(timezone.utc).isoformat()},
-        {"id": str(uuid.uuid4()), "name": "Notebook A4", "sku": "STAT-001", "category": "Stationery", "quantity": 500, "unit_price": 3.99, "reorder_level": 100, "description": "Ruled notebook", "created_at": datetime.now(timezone.utc).isoformat(), "updated_at": datetime.now(timezone.utc).isoformat()},
-        {"id": str(uuid.uuid4()), "name": "Ballpoint Pens (Pack of 10)", "sku": "STAT-002", "category": "Stationery", "quantity": 5, "unit_price": 5.99, "reorder_level": 50, "description": "Blue ink pens", "created_at": datetime.now(timezone.utc).isoformat(), "updated_at": datetime.now(timezone.utc).isoformat()},
-        {"id": str(uuid.uuid4()), "name": "Business Shirt", "sku": "CLTH-001", "category": "Clothing", "quantity": 45, "unit_price": 49.99, "reorder_level": 20, "description": "Formal business shirt", "created_at": datetime.now(timezone.utc).isoformat(), "updated_at": datetime.now(timezone.utc).isoformat()},
-        {"id": str(uuid.uuid4()), "name": "Coffee Beans (1kg)", "sku": "FOOD-001", "category": "Food & Beverages", "quantity": 3, "unit_price": 24.99, "reorder_level": 20, "description": "Premium arabica beans", "created_at": datetime.now(timezone.utc).isoformat(), "updated_at": datetime.now(timezone.utc).isoformat()},
-        {"id": str(uuid.uuid4()), "name": "Bottled Water (24 pack)", "sku": "FOOD-002", "category": "Food & Beverages", "quantity": 80, "unit_price": 8.99, "reorder_level": 30, "description": "Natural spring water", "created_at": datetime.now(timezone.utc).isoformat(), "updated_at": datetime.now(timezone.utc).isoformat()},
-        {"id": str(uuid.uuid4()), "name": "USB-C Cable", "sku": "ELEC-003", "category": "Electronics", "quantity": 200, "unit_price": 12.99, "reorder_level": 80, "description": "2m USB-C charging cable", "created_at": datetime.now(timezone.utc).isoformat(), "updated_at": datetime.now(timezone.utc).isoformat()}
+        {
+            "id": uuid.uuid4().hex,
+            "name": name,
+            "sku": sku,
+            "category": category,
+            "quantity": quantity,
+            "unit_price": unit_price,
+            "reorder_level": reorder_level,
+            "description": description,
+            "created_at": now,
+            "updated_at": now
+        }
+        for name, sku, category, quantity, unit_price, reorder_level, description in SEED_PRODUCTS
     ]
     await db.products.insert_many(products)
     
@@ -314,6 +447,7 @@ app.add_middleware(
     allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count"],
 )
 
 logging.basicConfig(
@@ -322,6 +456,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def startup_db_client():
+    await client.aconnect()
+    await db.users.create_index("email", unique=True)
+    await db.users.create_index("id", unique=True)
+    await db.categories.create_index("name", unique=True)
+    await db.products.create_index("sku", unique=True)
+    await db.products.create_index("id", unique=True)
+    await db.products.create_index([("category", 1), ("quantity", 1), ("reorder_level", 1)])
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+    await client.close()
+    if redis_client:
+        await redis_client.aclose()
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "server:app",
+        app_dir=str(ROOT_DIR),
+        host=os.environ.get('HOST', '127.0.0.1'),
+        port=int(os.environ.get('PORT', '8000')),
+        # "auto" picks uvloop/httptools when installed (uvloop is unavailable on Windows).
+        loop="auto",
+        http="auto",
+        workers=int(os.environ.get('WEB_CONCURRENCY', os.cpu_count() or 1))
+    )
\ No newline at end of file